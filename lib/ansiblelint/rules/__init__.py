@@ -231,7 +231,7 @@ class RulesCollection(object):
     def extend(self, more: List[AnsibleLintRule]) -> None:
         self.rules.extend(more)
 
-    def run(self, playbookfile, tags=set(), skip_list=frozenset()) -> List:
+    def run(self, playbookfile, tags=frozenset(), skip_list=frozenset()) -> List:
         text = ""
         matches: List = list()
         error: Optional[IOError] = None
@@ -257,10 +257,10 @@ class RulesCollection(object):
                 rule=LoadingFailureRule())]
 
         for rule in self.rules:
-            if not tags or not set(rule.tags).union([rule.id]).isdisjoint(tags):
-                rule_definition = set(rule.tags)
-                rule_definition.add(rule.id)
-                if set(rule_definition).isdisjoint(skip_list):
+            rule_definition = set(rule.tags)
+            rule_definition.add(rule.id)
+            if not tags or not rule_definition.isdisjoint(tags):
+                if rule_definition.isdisjoint(skip_list):
                     matches.extend(rule.matchlines(playbookfile, text))
                     matches.extend(rule.matchtasks(playbookfile, text))
                     matches.extend(rule.matchyaml(
@@ -1,6 +1,8 @@
 """Runner implementation."""
 import logging
+import operator
 import os
+from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, FrozenSet, Generator, List, Optional, Set, Union
 
@@ -17,6 +19,9 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Same ordering as MatchError.__lt__, but compared as plain tuples
+_match_sort_key = operator.attrgetter('_hash_key')
+
 
 @dataclass
 class LintResult:
@@ -34,8 +39,8 @@ class Runner(object):
             rules: "RulesCollection",
             lintable: Union[Lintable, str],
             tags: FrozenSet[Any] = frozenset(),
-            skip_list: Optional[FrozenSet[Any]] = frozenset(),
-            exclude_paths: List[str] = [],
+            skip_list: Optional[FrozenSet[Any]] = None,
+            exclude_paths: Optional[List[str]] = None,
             verbosity: int = 0,
             checked_files: Optional[Set[str]] = None) -> None:
         """Initialize a Runner instance."""
@@ -60,6 +65,8 @@ class Runner(object):
                 file_type = "playbook"
             self.playbooks.add((playbook, file_type))
         self.tags = tags
+        if skip_list is None:
+            skip_list = frozenset()
         self.skip_list = skip_list
         self._update_exclude_paths(exclude_paths)
         self.verbosity = verbosity
@@ -67,7 +74,7 @@ class Runner(object):
             checked_files = set()
         self.checked_files = checked_files
 
-    def _update_exclude_paths(self, exclude_paths: List[str]) -> None:
+    def _update_exclude_paths(self, exclude_paths: Optional[List[str]]) -> None:
         if exclude_paths:
             # These will be (potentially) relative paths
             paths = ansiblelint.file_utils.expand_paths_vars(exclude_paths)
@@ -77,13 +84,17 @@ class Runner(object):
             self.exclude_paths = paths + [os.path.abspath(p) for p in paths]
         else:
             self.exclude_paths = []
+        # Drop paths already covered by a shorter prefix and keep the rest as
+        # a tuple, as str.startswith accepts one and does the loop in C.
+        prefixes: List[str] = []
+        for path in sorted(set(self.exclude_paths), key=len):
+            if not path.startswith(tuple(prefixes)):
+                prefixes.append(path)
+        self._exclude_prefixes = tuple(prefixes)
 
     def is_excluded(self, file_path: str) -> bool:
         """Verify if a file path should be excluded."""
-        # Any will short-circuit as soon as something returns True, but will
-        # be poor performance for the case where the path under question is
-        # not excluded.
-        return any(file_path.startswith(path) for path in self.exclude_paths)
+        return file_path.startswith(self._exclude_prefixes)
 
     def run(self) -> List[MatchError]:
         """Execute the linting process."""
@@ -98,35 +109,43 @@ class Runner(object):
                           'absolute_directory': os.path.dirname(playbook[0])})
         matches = set(self._emit_matches(files))
 
-        # remove duplicates from files list
-        files = [value for n, value in enumerate(files) if value not in files[:n]]
-
         # remove files that have already been checked
         files = [x for x in files if x['path'] not in self.checked_files]
+        tags = frozenset(self.tags)
+        debug = _logger.isEnabledFor(logging.DEBUG)
         for file in files:
-            _logger.debug(
-                "Examining %s of type %s",
-                ansiblelint.file_utils.normpath(file['path']),
-                file['type'])
-            matches = matches.union(
-                self.rules.run(file, tags=set(self.tags),
-                               skip_list=self.skip_list))
+            if debug:
+                # paths coming from find_children are not normalized
+                _logger.debug(
+                    "Examining %s of type %s",
+                    ansiblelint.file_utils.normpath(file['path']),
+                    file['type'])
+            matches.update(
+                self.rules.run(file, tags=tags, skip_list=self.skip_list))
         # update list of checked files
         self.checked_files.update([x['path'] for x in files])
 
-        return sorted(matches)
+        return sorted(matches, key=_match_sort_key)
 
     def _emit_matches(self, files: List) -> Generator[MatchError, None, None]:
-        visited: Set = set()
-        while visited != self.playbooks:
-            for arg in self.playbooks - visited:
-                try:
-                    for child in ansiblelint.utils.find_children(arg, self.playbook_dir):
-                        if self.is_excluded(child['path']):
-                            continue
-                        self.playbooks.add((child['path'], child['type']))
-                        files.append(child)
-                except MatchError as e:
-                    e.rule = LoadingFailureRule()
-                    yield e
-                visited.add(arg)
+        queue = deque(self.playbooks)
+        # children can be included from several places, only list them once
+        seen_paths: Set[str] = {x['path'] for x in files}
+        while queue:
+            arg = queue.popleft()
+            try:
+                for child in ansiblelint.utils.find_children(arg, self.playbook_dir):
+                    if self.is_excluded(child['path']):
+                        continue
+                    # self.playbooks doubles as the set of already queued items
+                    item = (child['path'], child['type'])
+                    if item not in self.playbooks:
+                        self.playbooks.add(item)
+                        queue.append(item)
+                    if child['path'] in seen_paths:
+                        continue
+                    seen_paths.add(child['path'])
+                    files.append(child)
+            except MatchError as e:
+                e.rule = LoadingFailureRule()
+                yield e
@@ -20,6 +20,7 @@
 """Generic utility helpers."""
 
 import contextlib
+import copy
 import inspect
 import logging
 import os
@@ -80,6 +81,21 @@ def parse_yaml_from_file(filepath: str) -> dict:
     return dl.load_from_file(filepath)
 
 
+@lru_cache(maxsize=1024)
+def _cached_parse_yaml_from_file(filepath: str, mtime: int, size: int) -> Any:
+    # mtime and size are only part of the cache key, so modified files get
+    # parsed again
+    return parse_yaml_from_file(filepath)
+
+
+def _parse_playbook_from_file(filepath: str) -> Any:
+    """Parse a playbook, reusing the result while the file is unchanged."""
+    stat = os.stat(filepath)
+    # callers are free to modify what they get, so never hand out cached data
+    return copy.deepcopy(_cached_parse_yaml_from_file(
+        os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size))
+
+
 def path_dwim(basedir: str, given: str) -> str:
     dl = DataLoader()
     dl.set_basedir(basedir)
@@ -186,7 +202,7 @@ def find_children(playbook: Tuple[str, str], playbook_dir: str) -> List:
         playbook_ds = {'roles': [{'role': playbook[0]}]}
     else:
         try:
-            playbook_ds = parse_yaml_from_file(playbook[0])
+            playbook_ds = _parse_playbook_from_file(playbook[0])
         except AnsibleError as e:
             raise SystemExit(str(e))
     results = []
@@ -99,3 +99,67 @@ def test_files_not_scanned_twice(default_rules_collection) -> None:
     run2 = runner.run()
 
     assert (len(run1) + len(run2)) == 3
+
+
+def _touch(path) -> None:
+    """Move mtime forward, so the change is seen even on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_runner_sees_edited_playbook(default_rules_collection, tmp_path) -> None:
+    """A playbook modified between runs has its new children linted."""
+    for name in ('a.yml', 'b.yml'):
+        (tmp_path / name).write_text('- debug:\n    msg: hello\n')
+    playbook = tmp_path / 'site.yml'
+    playbook.write_text('- hosts: all\n  tasks:\n    - import_tasks: a.yml\n')
+
+    runner = Runner(rules=default_rules_collection, lintable=str(playbook))
+    runner.run()
+    assert str(tmp_path / 'a.yml') in runner.checked_files
+
+    playbook.write_text('- hosts: all\n  tasks:\n    - import_tasks: b.yml\n')
+    _touch(playbook)
+    runner = Runner(rules=default_rules_collection, lintable=str(playbook))
+    runner.run()
+    assert str(tmp_path / 'a.yml') not in runner.checked_files
+    assert str(tmp_path / 'b.yml') in runner.checked_files
+
+
+def test_runner_sees_new_role_file(default_rules_collection, tmp_path) -> None:
+    """Files added to an existing role directory are linted on the next run."""
+    role = tmp_path / 'r'
+    (role / 'tasks').mkdir(parents=True)
+    (role / 'handlers').mkdir()
+    (role / 'tasks' / 'main.yml').write_text('- debug:\n    msg: hello\n')
+
+    runner = Runner(rules=default_rules_collection, lintable=str(role))
+    runner.run()
+    handlers = str(role / 'handlers' / 'main.yml')
+    assert handlers not in runner.checked_files
+
+    (role / 'handlers' / 'main.yml').write_text(
+        '- name: restart\n  debug:\n    msg: hello\n')
+    runner = Runner(rules=default_rules_collection, lintable=str(role))
+    runner.run()
+    assert handlers in runner.checked_files
+
+
+def test_runner_sets_collection_paths(default_rules_collection, tmp_path) -> None:
+    """Each run points the collection loader at its own playbook directory."""
+    # AnsibleCollectionConfig only exists on Ansible 2.10+
+    collection_config = pytest.importorskip(
+        'ansible.utils.collection_loader._collection_config')
+
+    for name in ('a', 'b'):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'site.yml').write_text(
+            '- hosts: all\n  tasks:\n    - debug:\n        msg: hello\n')
+
+    for name in ('a', 'b', 'a'):
+        Runner(
+            rules=default_rules_collection,
+            lintable=str(tmp_path / name / 'site.yml')).run()
+
+    assert collection_config.AnsibleCollectionConfig.playbook_paths == [
+        str(tmp_path / 'a' / 'collections')]